@@ -129,6 +129,23 @@ WRAPPERS = {
             "category": "Assignment 5 Figures",
         },
     },
+    "sweep": {
+        "run_sweep": {
+            "script": "main/assignment7/bundle/scripts/sweep.py",
+            "description": "Run a set of configs; --resume skips configs that already finished",
+            "category": "Sweeps",
+        },
+        "run_threshold_sweep": {
+            "script": "main/assignment7/bundle/scripts/thresholds.py",
+            "description": "Sweep ap_threshold/ap_probability and interpolate the value meeting a target",
+            "category": "Sweeps",
+        },
+        "run_regions": {
+            "script": "main/assignment7/bundle/scripts/regions.py",
+            "description": "Run one policy config over several traces and consolidate the results",
+            "category": "Sweeps",
+        },
+    },
 }
 
 
@@ -171,8 +188,8 @@ def list_wrappers(category: str | None = None) -> None:
     print("       python run_all.py --list [category]")
 
 
-def run_wrapper(name: str) -> None:
-    """Run a wrapper by name."""
+def run_wrapper(name: str, wrapper_args: list[str] | None = None) -> None:
+    """Run a wrapper by name, forwarding any extra arguments to it."""
     # Find the wrapper
     wrapper_info = None
     for category_dict in WRAPPERS.values():
@@ -212,7 +229,7 @@ def run_wrapper(name: str) -> None:
     try:
         # Run as module from project root
         subprocess.run(
-            [sys.executable, "-m", module_path],
+            [sys.executable, "-m", module_path, *(wrapper_args or [])],
             cwd=str(project_root),
             check=True,
         )
@@ -233,6 +250,7 @@ Examples:
   python run_all.py --list a4                 # List Assignment 4 wrappers
   python run_all.py create_a4_configs         # Run create_a4_configs wrapper
   python run_all.py generate_a4_figure_5      # Generate Assignment 4 figure 5
+  python run_all.py run_sweep --resume runs/a5  # Resume an interrupted sweep
         """,
     )
     
@@ -251,6 +269,12 @@ Examples:
         help="List available wrappers (optionally filtered by category)",
     )
     
+    parser.add_argument(
+        "wrapper_args",
+        nargs=argparse.REMAINDER,
+        help="Extra arguments forwarded to the wrapper",
+    )
+    
     args = parser.parse_args()
     
     # Change to project root
@@ -264,7 +288,7 @@ Examples:
         list_wrappers(category)
     elif args.wrapper:
         # Run mode
-        run_wrapper(args.wrapper)
+        run_wrapper(args.wrapper, args.wrapper_args)
     else:
         # No arguments - show help and list all
         parser.print_help()
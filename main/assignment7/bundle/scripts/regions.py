@@ -0,0 +1,184 @@
+"""Multi-region batch driver that runs one policy over several traces.
+
+The reproduce scripts run the same policy over Region1-Region7 as separate
+commands. This driver takes a base config and a list of trace groups/regions
+(e.g. ``201910/Region1 202110/Region4 20230325/Region5``). It derives one
+config per trace under ``<output_dir>/regions/``, schedules them together
+through the sweep driver (``--jobs`` and ``--resume`` apply), and writes one
+consolidated results table.
+
+Usage (from the project root)::
+
+    python -m main.assignment7.bundle.scripts.regions runs/a4/e2_ede/config.json \\
+        --traces 201910/Region1 201910/Region2 201910/Region3 202110/Region4 --jobs 4
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .results import metrics_for_output_dir, result_stem
+from .sweep import DEFAULT_TIMEOUT, is_complete, mark_derived, output_dir_for, run_sweep
+from .utils import get_project_root
+
+__all__ = [
+    "RESULTS_NAME",
+    "TABLE_COLUMNS",
+    "write_region_configs",
+    "main",
+]
+
+RESULTS_NAME = "regions_results.csv"
+TABLE_COLUMNS = ["trace", "peak_dt", "median_dt", "hit_rate", "flash_write_traffic_gb"]
+
+
+def _normalise_trace(trace: str) -> str:
+    """Return ``<trace group>/<region>`` without stray slashes."""
+    return PurePosixPath(trace.strip("/")).as_posix()
+
+
+def write_region_configs(
+    base_config_path: Union[str, Path],
+    traces: Sequence[str],
+) -> Tuple[Path, List[Path]]:
+    """Write one config per ``<trace group>/<region>`` under ``<output_dir>/regions/``.
+
+    The trace root is taken from the base config's trace path
+    (``<root>/<trace group>/<region>/<file>``), so each derived config keeps
+    the base config's root and trace file name (e.g. ``full_0_0.1.trace``) and
+    only swaps in ``<trace group>/<region>``.
+
+    The regions directory is marked as derived, so recursive sweeps over the
+    base config's tree do not re-run these configs.
+
+    Only ``trace`` and ``output_dir`` are swapped. If any other string value of
+    the base config names the base ``<trace group>/<region>`` (either as a path
+    or as ``<trace group>_<region>``, e.g. a learned model or episode analysis
+    trained on that trace), deriving a config for a different region raises
+    ``ValueError`` rather than silently reusing the base region's artifacts.
+    Traces that normalise to the same region, or whose derived trace file does
+    not exist, also raise ``ValueError`` before any config is written.
+
+    Returns the regions directory and the config paths, in the order of ``traces``.
+    """
+    base_config_path = Path(base_config_path)
+    with open(base_config_path, "r") as f:
+        base_config = json.load(f)
+
+    base_trace = Path(base_config["trace"])
+    if len(base_trace.parents) < 3:
+        raise ValueError(
+            f"trace {base_config['trace']!r} is not of the form <root>/<trace group>/<region>/<file>"
+        )
+    trace_root = base_trace.parents[2]
+    base_region = f"{base_trace.parents[1].name}/{base_trace.parent.name}"
+    region_keys = sorted(
+        key for key, value in base_config.items()
+        if key not in ("trace", "output_dir") and isinstance(value, str)
+        and (base_region in value or base_region.replace("/", "_") in value)
+    )
+    regions = [_normalise_trace(trace) for trace in traces]
+    duplicates = sorted({region for region in regions if regions.count(region) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate traces: {', '.join(duplicates)}")
+    other_regions = [region for region in regions if region != base_region]
+    if region_keys and other_regions:
+        raise ValueError(
+            f"base config keys {', '.join(region_keys)} refer to {base_region} and would be "
+            f"reused for {', '.join(other_regions)}; use a base config without region-specific artifacts"
+        )
+    trace_paths = [trace_root / region / base_trace.name for region in regions]
+    missing = [str(path) for path in trace_paths if not path.is_file()]
+    if missing:
+        raise ValueError(f"trace files not found: {', '.join(missing)}")
+
+    base_output_dir = base_config.get("output_dir") or str(base_config_path.parent)
+    regions_dir = output_dir_for(base_config_path) / "regions"
+    mark_derived(regions_dir)
+
+    config_paths = []
+    for region, trace_path in zip(regions, trace_paths):
+        name = region.replace("/", "_")
+        config = dict(base_config)
+        config["trace"] = str(trace_path)
+        config["output_dir"] = f"{base_output_dir}/regions/{name}"
+
+        exp_dir = regions_dir / name
+        exp_dir.mkdir(parents=True, exist_ok=True)
+        config_path = exp_dir / "config.json"
+        with open(config_path, "w") as f:
+            json.dump(config, f, indent=2)
+        config_paths.append(config_path)
+    return regions_dir, config_paths
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run one policy config over several traces and consolidate the results",
+    )
+    parser.add_argument("config", help="base config.json whose policy is applied to every trace")
+    parser.add_argument(
+        "--traces",
+        nargs="+",
+        required=True,
+        help="trace group/region pairs under the base config's trace root, e.g. 201910/Region1",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="concurrent simulations")
+    parser.add_argument("--resume", action="store_true", help="skip checkpointed traces")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"per-simulation timeout in seconds (default: {DEFAULT_TIMEOUT:g})",
+    )
+    args = parser.parse_args(argv)
+
+    base_config = Path(args.config).resolve()
+    with open(base_config, "r") as f:
+        stem = result_stem(json.load(f)["trace"])
+    os.chdir(get_project_root())
+
+    try:
+        regions_dir, config_paths = write_region_configs(base_config, args.traces)
+    except ValueError as e:
+        parser.error(str(e))
+    counts = run_sweep(config_paths, resume=args.resume, timeout=args.timeout, jobs=args.jobs)
+
+    rows: List[Dict[str, Any]] = []
+    for trace, config_path in zip(map(_normalise_trace, args.traces), config_paths):
+        # Only trust results whose status file says this config finished; a
+        # failed re-run leaves the previous cache_perf file in place.
+        if not is_complete(config_path):
+            print(f"Warning: simulation for {trace} did not finish, leaving it out of the table")
+            continue
+        metrics = metrics_for_output_dir(output_dir_for(config_path), stem)
+        if metrics is None:
+            print(f"Warning: no results for {trace}")
+            continue
+        rows.append({"trace": trace, **{key: metrics[key] for key in TABLE_COLUMNS[1:]}})
+
+    print("\n" + "=" * 80)
+    print("MULTI-REGION RESULTS")
+    print("=" * 80)
+    for row in rows:
+        print(f"{row['trace']:24s} Peak DT = {row['peak_dt']:.3f}s, "
+              f"Median DT = {row['median_dt']:.3f}s, Hit Rate = {row['hit_rate']:.1f}%")
+
+    results_file = regions_dir / RESULTS_NAME
+    with open(results_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TABLE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\nResults saved to: {results_file}")
+
+    if counts["failed"] or counts["timeout"] or len(rows) < len(args.traces):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Helpers for locating and reading BCacheSim result files.
+
+Result files may be written with any of the stdlib codecs (lzma/xz, gzip,
+bz2) or uncompressed; readers detect the codec from the file's magic bytes
+rather than its suffix. The metrics mirror ``extract_metrics_from_run`` in the
+assignment simulation scripts, so bundle drivers report the same numbers as
+the figures.
+"""
+from __future__ import annotations
+
+import bz2
+import gzip
+import json
+import lzma
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Union
+
+__all__ = [
+    "DEFAULT_RESULT_STEM",
+    "RESULT_SUFFIXES",
+    "result_stem",
+    "detect_codec",
+    "open_result",
+    "find_result_file",
+    "load_result",
+    "extract_metrics",
+    "stats_for_output_dir",
+    "metrics_for_output_dir",
+]
+
+# simulate_ap writes <output_dir>/<policy-dir>/<trace stem>_cache_perf.txt[.<codec>]
+DEFAULT_RESULT_STEM = "full_0_0.1_cache_perf.txt"
+RESULT_SUFFIXES = ("", ".lzma", ".xz", ".gz", ".bz2")
+
+# Leading bytes of each supported container. Legacy .lzma ("alone") streams
+# have no fixed magic; they start with the properties byte, 0x5d for every
+# standard preset (0-9).
+_MAGIC = (
+    (b"\xfd7zXZ\x00", "lzma"),
+    (b"\x5d\x00\x00", "lzma"),
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+)
+
+
+def detect_codec(path: Union[str, Path]) -> str:
+    """Return ``lzma``, ``gzip``, ``bz2`` or ``none`` based on the file's magic bytes."""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            return codec
+    return "none"
+
+
+def open_result(path: Union[str, Path]) -> IO[str]:
+    """Open a result file for text reading, decompressing as needed."""
+    codec = detect_codec(path)
+    if codec == "lzma":
+        return lzma.open(path, "rt")
+    if codec == "gzip":
+        return gzip.open(path, "rt")
+    if codec == "bz2":
+        return bz2.open(path, "rt")
+    return open(path, "r")
+
+
+def result_stem(trace: Union[str, Path]) -> str:
+    """Return the cache_perf file name simulate_ap writes for ``trace``, without codec suffix.
+
+    ``full_0_0.1.trace`` gives ``full_0_0.1_cache_perf.txt``.
+    """
+    return f"{Path(trace).stem}_cache_perf.txt"
+
+
+def find_result_file(
+    directory: Union[str, Path],
+    stem: str = DEFAULT_RESULT_STEM,
+) -> Optional[Path]:
+    """Return the newest ``stem`` result file for a run, if any.
+
+    Only the codec suffix may vary, so results of other samples of the trace
+    in the same directory are never picked up. ``directory`` may be a config's
+    ``output_dir`` (results live one level down, in the policy directory) or
+    that policy directory itself.
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return None
+    candidates = [
+        p for pattern in (f"*/{stem}*", f"{stem}*")
+        for p in directory.glob(pattern)
+        if p.is_file() and p.name[len(stem):] in RESULT_SUFFIXES
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def load_result(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a cache_perf result file into a dict, whatever its codec."""
+    with open_result(path) as f:
+        return json.load(f)
+
+
+def extract_metrics(stats: Dict[str, Any]) -> Dict[str, float]:
+    """Derive the headline metrics from a result's ``stats`` section.
+
+    Peak and median DT are reported in seconds and hit rate in percent.
+    """
+    chunk_hits = float(stats.get("chunk_hits", 0))
+    chunk_queries = float(stats.get("chunk_queries", 0))
+    return {
+        "peak_dt": stats.get("service_time_used3", 0) / 1000.0,
+        "median_dt": stats.get("service_time_used2", 0) / 1000.0,
+        "hit_rate": (chunk_hits / chunk_queries * 100) if chunk_queries > 0 else 0,
+        "flash_write_traffic_gb": stats.get("flash_write_traffic_gb", 0),
+        "chunk_hits": chunk_hits,
+        "chunk_queries": chunk_queries,
+    }
+
+
+def stats_for_output_dir(
+    output_dir: Union[str, Path],
+    stem: str = DEFAULT_RESULT_STEM,
+) -> Optional[Dict[str, Any]]:
+    """Return the raw ``stats`` section of a run's ``stem`` result file, or ``None``."""
+    result_file = find_result_file(output_dir, stem)
+    if result_file is None:
+        return None
+    return load_result(result_file)["stats"]
+
+
+def metrics_for_output_dir(
+    output_dir: Union[str, Path],
+    stem: str = DEFAULT_RESULT_STEM,
+) -> Optional[Dict[str, Any]]:
+    """Return the raw stats merged with derived metrics for a run, or ``None``.
+
+    Derived metric names take precedence over raw stats keys of the same name.
+    Derived metrics default missing stats to 0; use ``stats_for_output_dir``
+    to check which keys the simulator actually reported.
+    """
+    stats = stats_for_output_dir(output_dir, stem)
+    if stats is None:
+        return None
+    return {**stats, **extract_metrics(stats)}
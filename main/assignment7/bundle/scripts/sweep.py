@@ -0,0 +1,410 @@
+"""Sweep driver that runs BCacheSim over a set of experiment configs.
+
+Every simulation that finishes leaves a status file (``sweep_checkpoint.json``)
+in its config's ``output_dir``, written atomically (temporary file plus
+``os.replace``). With ``--resume`` the driver skips every config whose status
+file reports success for the current config contents and re-runs the rest.
+
+These are sweep-level markers, not simulator checkpoints: ``simulate_ap``
+state is not saved, so a simulation that is interrupted part-way restarts
+from the first request of its trace.
+
+With ``--jobs N`` up to N separate configs run concurrently, each in its own
+``simulate_ap`` process, with its output in ``sweep.log`` in its ``output_dir``
+rather than the shared terminal. This parallelises across configs only; a
+single config still runs on one core. Ctrl-C cancels queued configs and terminates running
+simulations; interrupted runs get no status file, so ``--resume`` re-runs them.
+
+Usage (from the project root)::
+
+    python -m main.assignment7.bundle.scripts.sweep runs/a4/fig_4_cache_size_sensitivity
+    python -m main.assignment7.bundle.scripts.sweep --resume runs/a5
+    python -m main.assignment7.bundle.scripts.sweep --jobs 8 runs/a4
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Union
+
+from .utils import get_project_root
+
+__all__ = [
+    "CHECKPOINT_NAME",
+    "LOG_NAME",
+    "DERIVED_MARKER",
+    "SIMULATE_MODULE",
+    "mark_derived",
+    "collect_configs",
+    "config_digest",
+    "output_dir_for",
+    "read_checkpoint",
+    "write_checkpoint",
+    "is_complete",
+    "run_config",
+    "run_sweep",
+    "main",
+]
+
+CHECKPOINT_NAME = "sweep_checkpoint.json"
+LOG_NAME = "sweep.log"
+# Marks a directory of configs generated by another driver (threshold or
+# region sweeps) so that recursive searches from above do not pick them up.
+DERIVED_MARKER = ".derived_configs"
+SIMULATE_MODULE = "BCacheSim.cachesim.simulate_ap"
+DEFAULT_TIMEOUT = 3600.0
+
+# Exit statuses of a Python child that died from Ctrl-C: killed by SIGINT, or
+# exited via an unhandled KeyboardInterrupt.
+_SIGINT_RETURNCODES = (-signal.SIGINT, 128 + signal.SIGINT)
+
+# Simulator processes currently running, so an interrupt can terminate them.
+_running: Set[subprocess.Popen] = set()
+_running_lock = threading.Lock()
+_interrupted = threading.Event()
+
+
+def mark_derived(directory: Union[str, Path]) -> None:
+    """Mark ``directory`` as holding generated configs (see ``DERIVED_MARKER``)."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / DERIVED_MARKER).touch()
+
+
+def _is_derived(config_path: Path, root: Path) -> bool:
+    """Return True if a directory below ``root`` on the way to the config is marked derived."""
+    relative_dir = config_path.parent.relative_to(root)
+    return any(
+        (root / directory / DERIVED_MARKER).exists()
+        for directory in [relative_dir, *relative_dir.parents]
+        if directory != Path(".")
+    )
+
+
+def collect_configs(paths: Iterable[Union[str, Path]]) -> List[Path]:
+    """Expand config files and directories into a de-duplicated config list.
+
+    Directories are searched recursively for ``config.json``, skipping configs
+    below a directory marked with ``DERIVED_MARKER`` unless that directory is
+    itself the one searched. Explicit files are kept in the order given.
+    """
+    configs: List[Path] = []
+    seen = set()
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            candidates = [
+                c for c in sorted(path.rglob("config.json")) if not _is_derived(c, path)
+            ]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            key = candidate.resolve()
+            if key not in seen:
+                seen.add(key)
+                configs.append(candidate)
+    return configs
+
+
+def config_digest(config_path: Union[str, Path]) -> str:
+    """Return the SHA-256 of a config file, used to invalidate stale checkpoints."""
+    return hashlib.sha256(Path(config_path).read_bytes()).hexdigest()
+
+
+def output_dir_for(config_path: Union[str, Path]) -> Path:
+    """Return the ``output_dir`` a config writes to, resolved against the project root.
+
+    Falls back to the config's own directory when ``output_dir`` is unset.
+    """
+    config_path = Path(config_path)
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    output_dir = config.get("output_dir")
+    if not output_dir:
+        return config_path.resolve().parent
+    output_dir = Path(output_dir)
+    if not output_dir.is_absolute():
+        output_dir = get_project_root() / output_dir
+    return output_dir
+
+
+def read_checkpoint(config_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Load the checkpoint for a config, or ``None`` if missing or unreadable."""
+    checkpoint = output_dir_for(config_path) / CHECKPOINT_NAME
+    try:
+        with open(checkpoint, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_checkpoint(config_path: Union[str, Path], record: Dict[str, Any]) -> Path:
+    """Atomically write ``record`` as the checkpoint for a config."""
+    output_dir = output_dir_for(config_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = output_dir / CHECKPOINT_NAME
+    fd, tmp_name = tempfile.mkstemp(dir=output_dir, prefix=f".{CHECKPOINT_NAME}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(record, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, checkpoint)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return checkpoint
+
+
+def is_complete(config_path: Union[str, Path]) -> bool:
+    """Return True if the config already finished with its current contents."""
+    record = read_checkpoint(config_path)
+    return (
+        record is not None
+        and record.get("status") == "done"
+        and record.get("config_sha256") == config_digest(config_path)
+    )
+
+
+def _clear_checkpoint(config_path: Union[str, Path]) -> None:
+    """Remove a config's status file before its simulation is re-run."""
+    checkpoint = output_dir_for(config_path) / CHECKPOINT_NAME
+    if checkpoint.exists():
+        checkpoint.unlink()
+
+
+def _run_simulation(
+    cmd: Sequence[Union[str, Path]],
+    *,
+    timeout: Optional[float],
+    log_file: Optional[Path],
+) -> int:
+    """Run a simulator process and return its exit status.
+
+    The process is registered so that an interrupt can terminate it, and is
+    killed if this call is left early (timeout or KeyboardInterrupt).
+    """
+    command = [str(arg) for arg in cmd]
+    print(f"[bundle] running: {' '.join(command)}")
+    if log_file is not None:
+        print(f"[bundle] log: {log_file}")
+
+    log = open(log_file, "w") if log_file is not None else None
+    try:
+        with _running_lock:
+            if _interrupted.is_set():
+                raise KeyboardInterrupt
+            proc = subprocess.Popen(
+                command,
+                cwd=str(get_project_root()),
+                stdout=log,
+                stderr=subprocess.STDOUT if log is not None else None,
+                text=True,
+            )
+            _running.add(proc)
+        try:
+            return proc.wait(timeout=timeout)
+        except BaseException:
+            proc.terminate()
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            raise
+        finally:
+            with _running_lock:
+                _running.discard(proc)
+    finally:
+        if log is not None:
+            log.close()
+
+
+def _terminate_running() -> None:
+    """Stop all queued work and terminate every running simulator process."""
+    _interrupted.set()
+    with _running_lock:
+        for proc in _running:
+            proc.terminate()
+
+
+def run_config(
+    config_path: Union[str, Path],
+    *,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    log_to_file: bool = False,
+) -> Dict[str, Any]:
+    """Run one simulation and checkpoint its outcome.
+
+    If ``log_to_file`` is set, the simulator's output is written to
+    ``LOG_NAME`` in the config's ``output_dir``.
+
+    Returns the checkpoint record; ``status`` is one of ``done``, ``failed`` or
+    ``timeout``. Raises KeyboardInterrupt, without writing a status file, if
+    the run was interrupted.
+    """
+    config_path = Path(config_path)
+    digest = config_digest(config_path)
+    log_file: Optional[Path] = None
+    if log_to_file:
+        output_dir = output_dir_for(config_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        log_file = output_dir / LOG_NAME
+    cmd: List[Union[str, Path]] = [
+        sys.executable, "-B", "-m", SIMULATE_MODULE,
+        "--config", config_path,
+        "--ignore-existing",
+    ]
+
+    # A stale "done" must not survive if this re-run is interrupted after the
+    # simulator has started overwriting the previous results.
+    _clear_checkpoint(config_path)
+
+    start = time.monotonic()
+    returncode: Optional[int] = None
+    try:
+        returncode = _run_simulation(cmd, timeout=timeout, log_file=log_file)
+    except subprocess.TimeoutExpired:
+        status = "timeout"
+    else:
+        if _interrupted.is_set() or returncode in _SIGINT_RETURNCODES:
+            raise KeyboardInterrupt
+        status = "done" if returncode == 0 else "failed"
+
+    record = {
+        "config": str(config_path),
+        "config_sha256": digest,
+        "status": status,
+        "returncode": returncode,
+        "elapsed_s": round(time.monotonic() - start, 3),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    write_checkpoint(config_path, record)
+    return record
+
+
+def run_sweep(
+    configs: Sequence[Union[str, Path]],
+    *,
+    resume: bool = False,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    jobs: int = 1,
+) -> Dict[str, int]:
+    """Run every config, optionally skipping checkpointed ones.
+
+    With ``jobs > 1`` up to ``jobs`` simulations run at once, each logging to
+    its own ``output_dir``; otherwise configs run in order on the terminal.
+
+    Returns counts of ``done``, ``skipped``, ``failed``, ``timeout`` and
+    ``missing`` configs.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be >= 1, got {jobs}")
+
+    counts = {"done": 0, "skipped": 0, "failed": 0, "timeout": 0, "missing": 0}
+    total = len(configs)
+    pending: List[Path] = []
+    for i, config_path in enumerate(configs, 1):
+        config_path = Path(config_path)
+        if not config_path.exists():
+            print(f"[{i}/{total}] Config file not found: {config_path}")
+            counts["missing"] += 1
+        elif resume and is_complete(config_path):
+            print(f"[{i}/{total}] Checkpoint found, skipping {config_path}")
+            counts["skipped"] += 1
+        else:
+            pending.append(config_path)
+
+    _interrupted.clear()
+    if jobs == 1:
+        for i, config_path in enumerate(pending, 1):
+            print(f"\n[{i}/{len(pending)}] {config_path}")
+            record = run_config(config_path, timeout=timeout)
+            counts[record["status"]] += 1
+            print(f"  {record['status']} in {record['elapsed_s']:.1f}s")
+        return counts
+
+    # Each worker thread only waits on its simulate_ap child process, so a
+    # thread pool is enough to keep `jobs` simulator processes busy.
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        futures = {
+            pool.submit(run_config, config_path, timeout=timeout, log_to_file=True): config_path
+            for config_path in pending
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            counts[record["status"]] += 1
+            print(f"[{i}/{len(pending)}] {record['status']} in {record['elapsed_s']:.1f}s: {futures[future]}")
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        _terminate_running()
+        raise
+    finally:
+        pool.shutdown(wait=True)
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Run BCacheSim over a set of configs, optionally skipping finished ones",
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="config.json files or directories to search recursively for them",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip configs whose status file shows a finished run of the same config",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"per-simulation timeout in seconds (default: {DEFAULT_TIMEOUT:g})",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="number of simulations to run concurrently (default: 1)",
+    )
+    args = parser.parse_args(argv)
+
+    configs = [path.resolve() for path in collect_configs(args.paths)]
+    os.chdir(get_project_root())
+    print(f"Total simulations to run: {len(configs)}")
+
+    try:
+        counts = run_sweep(configs, resume=args.resume, timeout=args.timeout, jobs=args.jobs)
+    except KeyboardInterrupt:
+        print("\nInterrupted; unfinished configs will be re-run with --resume.")
+        sys.exit(130)
+
+    print("\n" + "=" * 60)
+    print("SWEEP SUMMARY")
+    print("=" * 60)
+    for key, value in counts.items():
+        print(f"{key.capitalize()}: {value}")
+
+    if counts["failed"] or counts["timeout"] or counts["missing"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""Admission-threshold sweep that interpolates the value meeting a target.
+
+The reproduce flow searches ``ap_probability`` (RejectX, CoinFlip; RejectX
+keeps ``ap_threshold`` at 1) or ``ap_threshold`` (learned AP) until the flash
+write rate meets the training target, one full simulation at a time. This
+driver takes a vector of values, derives one config per value from a base
+config, and runs them together through the sweep driver (``--jobs`` and
+``--resume`` apply). It then reports the flash write rate, target metric and
+peak DT for each value and linearly interpolates the value at which the metric
+crosses ``--target``.
+
+The write rate in MB/s is derived from ``flash_write_traffic_gb`` over the
+measured part of the trace (``--trace-duration-s`` minus the config's
+``stats_start``) and scaled up by the trace's sample ratio, since the configs
+simulate a sampled trace (e.g. ``full_0_0.1.trace`` is a 0.1% sample) against
+a full-scale cache. It is the default metric, so ``--target`` can be given as a
+full-scale rate like ``train_target_wr``.
+
+Usage (from the project root)::
+
+    python -m main.assignment7.bundle.scripts.thresholds runs/example/rejectx/config.json \\
+        --values 0.3 0.4 0.5 0.6 0.7 --target 35.599 --trace-duration-s <trace seconds> --jobs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .results import extract_metrics, result_stem, stats_for_output_dir
+from .sweep import DEFAULT_TIMEOUT, is_complete, mark_derived, output_dir_for, run_sweep
+from .utils import get_project_root
+
+__all__ = [
+    "RESULTS_NAME",
+    "WRITE_RATE_METRIC",
+    "default_param",
+    "write_threshold_configs",
+    "sample_ratio_from_trace",
+    "write_rate_mbps",
+    "interpolate_threshold",
+    "main",
+]
+
+RESULTS_NAME = "threshold_sweep_results.json"
+WRITE_RATE_METRIC = "flash_write_rate_mbps"
+
+# Sampled traces are named full_<start>_<sample ratio in percent>.trace
+_SAMPLED_TRACE_RE = re.compile(r"^full_\d+_(\d+(?:\.\d+)?)\.trace$")
+
+
+def default_param(config: Dict[str, Any]) -> Optional[str]:
+    """Return the knob the reproduce flow tunes for the config's admission policy.
+
+    RejectX and CoinFlip tune ``ap_probability``; the learned admission policy
+    tunes ``ap_threshold``. Returns ``None`` for any other policy.
+    """
+    if config.get("rejectx_ap") or config.get("coinflip_ap") or config.get("ap") in ("rejectx", "coinflip"):
+        return "ap_probability"
+    if config.get("learned_ap") or config.get("ap") == "mlnew":
+        return "ap_threshold"
+    return None
+
+
+def write_threshold_configs(
+    base_config_path: Union[str, Path],
+    param: str,
+    values: Sequence[float],
+) -> Tuple[Path, List[Path]]:
+    """Write one config per value under ``<output_dir>/<param>_sweep/``.
+
+    The sweep directory is marked as derived, so recursive sweeps over the
+    base config's tree do not re-run these configs.
+
+    Directories are named from ``repr(value)`` so that values differing beyond
+    six significant digits do not collide; duplicate values are rejected.
+
+    Returns the sweep directory and the config paths, in the order of ``values``.
+    """
+    if len(set(values)) != len(values):
+        raise ValueError(f"duplicate {param} values: {list(values)}")
+
+    base_config_path = Path(base_config_path)
+    with open(base_config_path, "r") as f:
+        base_config = json.load(f)
+
+    base_output_dir = base_config.get("output_dir") or str(base_config_path.parent)
+    sweep_dir = output_dir_for(base_config_path) / f"{param}_sweep"
+    mark_derived(sweep_dir)
+
+    config_paths = []
+    for value in values:
+        name = f"{param}_{value!r}"
+        config = dict(base_config)
+        config[param] = value
+        config["output_dir"] = f"{base_output_dir}/{param}_sweep/{name}"
+
+        exp_dir = sweep_dir / name
+        exp_dir.mkdir(parents=True, exist_ok=True)
+        config_path = exp_dir / "config.json"
+        with open(config_path, "w") as f:
+            json.dump(config, f, indent=2)
+        config_paths.append(config_path)
+    return sweep_dir, config_paths
+
+
+def sample_ratio_from_trace(trace: Union[str, Path]) -> Optional[float]:
+    """Return the sample ratio in percent encoded in a trace file name, if any.
+
+    ``full_0_0.1.trace`` gives ``0.1``; names without a ratio give ``None``.
+    """
+    match = _SAMPLED_TRACE_RE.match(Path(trace).name)
+    return float(match.group(1)) if match else None
+
+
+def write_rate_mbps(
+    flash_write_traffic_gb: float,
+    trace_duration_s: float,
+    stats_start: float,
+    sample_ratio: float,
+) -> float:
+    """Return the full-scale average flash write rate in MB/s over the measured period.
+
+    Stats are only collected after ``stats_start``, so the traffic is divided
+    by the trace time remaining after the warm-up. The traffic of a
+    ``sample_ratio`` percent sample is scaled up to the full trace.
+    """
+    measured_s = trace_duration_s - stats_start
+    if measured_s <= 0:
+        raise ValueError(
+            f"trace duration {trace_duration_s:g}s does not extend past stats_start {stats_start:g}s"
+        )
+    if not 0 < sample_ratio <= 100:
+        raise ValueError(f"sample ratio must be in (0, 100] percent, got {sample_ratio:g}")
+    return flash_write_traffic_gb * 1024 / measured_s * 100 / sample_ratio
+
+
+def interpolate_threshold(
+    points: Sequence[Tuple[float, float]],
+    target: float,
+) -> Optional[float]:
+    """Linearly interpolate the x at which ``points`` first cross ``target``.
+
+    ``points`` are ``(value, metric)`` pairs in any order. Returns ``None`` if
+    the target is not bracketed by two neighbouring points.
+    """
+    ordered = sorted(points)
+    for (x0, y0), (x1, y1) in zip(ordered, ordered[1:]):
+        if y0 == target:
+            return x0
+        if (y0 - target) * (y1 - target) < 0:
+            return x0 + (target - y0) * (x1 - x0) / (y1 - y0)
+    if ordered and ordered[-1][1] == target:
+        return ordered[-1][0]
+    return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Sweep an admission threshold and interpolate the value meeting a target",
+    )
+    parser.add_argument("config", help="base config.json (RejectX, CoinFlip or learned AP)")
+    parser.add_argument(
+        "--param",
+        choices=["ap_threshold", "ap_probability"],
+        help="config key to sweep (default: ap_probability for RejectX/CoinFlip, "
+             "ap_threshold for learned AP)",
+    )
+    parser.add_argument(
+        "--values",
+        type=float,
+        nargs="+",
+        required=True,
+        help="values of --param to simulate",
+    )
+    parser.add_argument(
+        "--target",
+        type=float,
+        required=True,
+        help="target value of --metric, e.g. the training write rate",
+    )
+    parser.add_argument(
+        "--metric",
+        default=WRITE_RATE_METRIC,
+        help="stats key or derived metric to match against --target, in the target's "
+             f"unit (default: {WRITE_RATE_METRIC}, which needs --trace-duration-s)",
+    )
+    parser.add_argument(
+        "--trace-duration-s",
+        type=float,
+        help=f"length of the trace in seconds, used to derive {WRITE_RATE_METRIC}",
+    )
+    parser.add_argument(
+        "--sample-ratio",
+        type=float,
+        help="trace sample ratio in percent used to scale the write rate to full scale "
+             "(default: parsed from a full_<start>_<ratio>.trace name)",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="concurrent simulations")
+    parser.add_argument("--resume", action="store_true", help="skip checkpointed values")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"per-simulation timeout in seconds (default: {DEFAULT_TIMEOUT:g})",
+    )
+    args = parser.parse_args(argv)
+    if args.metric == WRITE_RATE_METRIC and args.trace_duration_s is None:
+        parser.error(f"--metric {WRITE_RATE_METRIC} requires --trace-duration-s")
+    if len(set(args.values)) != len(args.values):
+        parser.error("--values must not contain duplicates")
+
+    base_config = Path(args.config).resolve()
+    with open(base_config, "r") as f:
+        base = json.load(f)
+    stats_start = float(base.get("stats_start", 0))
+    sample_ratio = args.sample_ratio or sample_ratio_from_trace(base["trace"])
+    if args.trace_duration_s is not None and sample_ratio is None:
+        parser.error(f"cannot parse a sample ratio from trace {base['trace']!r}; pass --sample-ratio")
+    if args.param is None:
+        args.param = default_param(base)
+        if args.param is None:
+            parser.error(f"cannot infer --param for admission policy {base.get('ap')!r}; pass it explicitly")
+    os.chdir(get_project_root())
+
+    sweep_dir, config_paths = write_threshold_configs(base_config, args.param, args.values)
+    counts = run_sweep(config_paths, resume=args.resume, timeout=args.timeout, jobs=args.jobs)
+
+    rows: List[Dict[str, Any]] = []
+    points: List[Tuple[float, float]] = []
+    for value, config_path in zip(args.values, config_paths):
+        # Only trust results whose status file says this config finished; a
+        # failed re-run leaves the previous cache_perf file in place.
+        if not is_complete(config_path):
+            print(f"Warning: simulation for {args.param}={value!r} did not finish, ignoring its results")
+            continue
+        stats = stats_for_output_dir(output_dir_for(config_path), result_stem(base["trace"]))
+        metrics = None
+        if stats is not None:
+            metrics = {**stats, **extract_metrics(stats)}
+            # extract_metrics reports a missing traffic key as 0 GB; never
+            # turn that into a 0 MB/s point.
+            if "flash_write_traffic_gb" not in stats:
+                del metrics["flash_write_traffic_gb"]
+            elif args.trace_duration_s is not None:
+                metrics[WRITE_RATE_METRIC] = write_rate_mbps(
+                    stats["flash_write_traffic_gb"], args.trace_duration_s, stats_start, sample_ratio,
+                )
+        if metrics is None or args.metric not in metrics:
+            print(f"Warning: no '{args.metric}' result for {args.param}={value!r}")
+            continue
+        row = {
+            args.param: value,
+            args.metric: metrics[args.metric],
+            "peak_dt": metrics["peak_dt"],
+            "hit_rate": metrics["hit_rate"],
+        }
+        if WRITE_RATE_METRIC in metrics:
+            row[WRITE_RATE_METRIC] = metrics[WRITE_RATE_METRIC]
+        rows.append(row)
+        points.append((value, float(metrics[args.metric])))
+
+    print("\n" + "=" * 60)
+    print(f"{args.param.upper()} SWEEP")
+    print("=" * 60)
+    for row in sorted(rows, key=lambda r: r[args.param]):
+        line = f"{args.param} = {row[args.param]!r}: "
+        if WRITE_RATE_METRIC in row:
+            line += f"Write Rate = {row[WRITE_RATE_METRIC]:.3f} MB/s, "
+        if args.metric != WRITE_RATE_METRIC:
+            line += f"{args.metric} = {row[args.metric]:.3f}, "
+        print(line + f"Peak DT = {row['peak_dt']:.3f}s, Hit Rate = {row['hit_rate']:.1f}%")
+
+    estimate = interpolate_threshold(points, args.target)
+    if estimate is None:
+        print(f"\nTarget {args.metric} = {args.target:g} is not bracketed by the swept values.")
+    else:
+        print(f"\nInterpolated {args.param} for {args.metric} = {args.target:g}: {estimate:.6f}")
+
+    results_file = sweep_dir / RESULTS_NAME
+    with open(results_file, "w") as f:
+        json.dump({
+            "param": args.param,
+            "metric": args.metric,
+            "target": args.target,
+            "estimate": estimate,
+            "results": rows,
+        }, f, indent=2)
+    print(f"Results saved to: {results_file}")
+
+    if estimate is None or counts["failed"] or counts["timeout"] or len(rows) < len(args.values):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
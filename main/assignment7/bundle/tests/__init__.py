@@ -0,0 +1 @@
+"""Unit tests for the Assignment 7 bundle scripts."""
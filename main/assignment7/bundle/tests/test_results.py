@@ -0,0 +1,81 @@
+"""Tests for locating and decoding cache_perf result files."""
+import bz2
+import gzip
+import json
+import lzma
+import os
+
+import pytest
+
+from main.assignment7.bundle.scripts.results import (
+    detect_codec,
+    find_result_file,
+    load_result,
+    result_stem,
+)
+
+PAYLOAD = json.dumps({"stats": {"chunk_hits": 1}}).encode()
+
+
+@pytest.mark.parametrize(
+    "suffix, compress, codec",
+    [
+        (".xz", lambda data: lzma.compress(data, format=lzma.FORMAT_XZ), "lzma"),
+        (".lzma", lambda data: lzma.compress(data, format=lzma.FORMAT_ALONE), "lzma"),
+        (".gz", gzip.compress, "gzip"),
+        (".bz2", bz2.compress, "bz2"),
+        ("", lambda data: data, "none"),
+    ],
+)
+def test_detect_codec_and_load(tmp_path, suffix, compress, codec):
+    path = tmp_path / f"full_0_0.1_cache_perf.txt{suffix}"
+    path.write_bytes(compress(PAYLOAD))
+    assert detect_codec(path) == codec
+    assert load_result(path) == {"stats": {"chunk_hits": 1}}
+
+
+def test_detect_codec_ignores_suffix(tmp_path):
+    path = tmp_path / "full_0_0.1_cache_perf.txt.lzma"
+    path.write_bytes(gzip.compress(PAYLOAD))
+    assert detect_codec(path) == "gzip"
+    assert load_result(path)["stats"]["chunk_hits"] == 1
+
+
+def test_result_stem():
+    assert result_stem("data/tectonic/201910/Region1/full_0_0.1.trace") == "full_0_0.1_cache_perf.txt"
+
+
+def test_find_result_file_in_output_or_policy_dir(tmp_path):
+    policy_dir = tmp_path / "policy"
+    policy_dir.mkdir()
+    result = policy_dir / "full_0_0.1_cache_perf.txt.lzma"
+    result.write_bytes(lzma.compress(PAYLOAD))
+    assert find_result_file(tmp_path) == result
+    assert find_result_file(policy_dir) == result
+
+
+def test_find_result_file_keeps_the_sample(tmp_path):
+    policy_dir = tmp_path / "policy"
+    policy_dir.mkdir()
+    wanted = policy_dir / "full_0_0.1_cache_perf.txt.lzma"
+    other = policy_dir / "full_1_0.1_cache_perf.txt.lzma"
+    backup = policy_dir / "full_0_0.1_cache_perf.txt.bak"
+    for path in (wanted, other, backup):
+        path.write_bytes(lzma.compress(PAYLOAD))
+    os.utime(wanted, (1, 1))
+    assert find_result_file(tmp_path) == wanted
+    assert find_result_file(tmp_path, "full_1_0.1_cache_perf.txt") == other
+
+
+def test_find_result_file_prefers_newest_codec(tmp_path):
+    old = tmp_path / "full_0_0.1_cache_perf.txt.lzma"
+    new = tmp_path / "full_0_0.1_cache_perf.txt.gz"
+    old.write_bytes(lzma.compress(PAYLOAD))
+    new.write_bytes(gzip.compress(PAYLOAD))
+    os.utime(old, (1, 1))
+    assert find_result_file(tmp_path) == new
+
+
+def test_find_result_file_missing(tmp_path):
+    assert find_result_file(tmp_path) is None
+    assert find_result_file(tmp_path / "absent") is None
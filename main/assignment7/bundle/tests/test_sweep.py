@@ -0,0 +1,54 @@
+"""Tests for config collection and status files of the sweep driver."""
+import json
+
+from main.assignment7.bundle.scripts.sweep import (
+    DERIVED_MARKER,
+    collect_configs,
+    config_digest,
+    is_complete,
+    mark_derived,
+    write_checkpoint,
+)
+
+
+def _write_config(path, **config):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(config))
+    return path
+
+
+def test_collect_configs_recurses_and_deduplicates(tmp_path):
+    a = _write_config(tmp_path / "a" / "config.json", output_dir=str(tmp_path / "a"))
+    b = _write_config(tmp_path / "b" / "c" / "config.json", output_dir=str(tmp_path / "b"))
+    assert collect_configs([b, tmp_path]) == [b, a]
+
+
+def test_collect_configs_skips_derived_dirs(tmp_path):
+    base = _write_config(tmp_path / "exp" / "config.json")
+    derived = _write_config(tmp_path / "exp" / "ap_probability_sweep" / "v1" / "config.json")
+    mark_derived(derived.parent.parent)
+
+    assert (derived.parent.parent / DERIVED_MARKER).exists()
+    assert collect_configs([tmp_path]) == [base]
+    assert collect_configs([tmp_path / "exp"]) == [base]
+
+
+def test_collect_configs_includes_derived_dir_searched_directly(tmp_path):
+    derived = _write_config(tmp_path / "exp" / "regions" / "201910_Region2" / "config.json")
+    mark_derived(tmp_path / "exp" / "regions")
+    assert collect_configs([tmp_path / "exp" / "regions"]) == [derived]
+    assert collect_configs([derived]) == [derived]
+
+
+def test_is_complete_requires_done_and_matching_digest(tmp_path):
+    config = _write_config(tmp_path / "config.json", output_dir=str(tmp_path / "out"))
+    assert not is_complete(config)
+
+    write_checkpoint(config, {"status": "failed", "config_sha256": config_digest(config)})
+    assert not is_complete(config)
+
+    write_checkpoint(config, {"status": "done", "config_sha256": config_digest(config)})
+    assert is_complete(config)
+
+    _write_config(config, output_dir=str(tmp_path / "out"), ap_probability=0.5)
+    assert not is_complete(config)
@@ -0,0 +1,78 @@
+"""Tests for the pure helpers of the threshold sweep."""
+import json
+
+import pytest
+
+from main.assignment7.bundle.scripts.thresholds import (
+    default_param,
+    interpolate_threshold,
+    sample_ratio_from_trace,
+    write_rate_mbps,
+    write_threshold_configs,
+)
+
+
+def test_interpolate_between_bracketing_points():
+    points = [(0.5, 50.0), (0.3, 30.0), (0.7, 70.0)]
+    assert interpolate_threshold(points, 40.0) == pytest.approx(0.4)
+
+
+def test_interpolate_decreasing_metric():
+    points = [(0.1, 90.0), (0.9, 10.0)]
+    assert interpolate_threshold(points, 50.0) == pytest.approx(0.5)
+
+
+def test_interpolate_exact_hit_on_endpoints():
+    points = [(0.3, 30.0), (0.7, 70.0)]
+    assert interpolate_threshold(points, 30.0) == 0.3
+    assert interpolate_threshold(points, 70.0) == 0.7
+
+
+def test_interpolate_returns_none_when_not_bracketed():
+    assert interpolate_threshold([(0.3, 30.0), (0.7, 70.0)], 80.0) is None
+    assert interpolate_threshold([(0.3, 30.0)], 40.0) is None
+    assert interpolate_threshold([], 40.0) is None
+
+
+def test_sample_ratio_from_trace():
+    assert sample_ratio_from_trace("data/tectonic/201910/Region1/full_0_0.1.trace") == 0.1
+    assert sample_ratio_from_trace("full_3_10.trace") == 10.0
+    assert sample_ratio_from_trace("data/custom.trace") is None
+
+
+def test_write_rate_scales_sample_to_full_trace():
+    # 1 GB written by a 0.1% sample over 1024 measured seconds
+    assert write_rate_mbps(1.0, 2024.0, 1000.0, 0.1) == pytest.approx(1000.0)
+    assert write_rate_mbps(1.0, 1024.0, 0.0, 100.0) == pytest.approx(1.0)
+
+
+def test_write_rate_rejects_bad_inputs():
+    with pytest.raises(ValueError):
+        write_rate_mbps(1.0, 86400.0, 86400.0, 0.1)
+    with pytest.raises(ValueError):
+        write_rate_mbps(1.0, 2 * 86400.0, 86400.0, 0.0)
+
+
+def test_default_param_follows_admission_policy():
+    assert default_param({"ap": "rejectx", "rejectx_ap": True}) == "ap_probability"
+    assert default_param({"ap": "coinflip", "coinflip_ap": True}) == "ap_probability"
+    assert default_param({"ap": "mlnew", "learned_ap": True}) == "ap_threshold"
+    assert default_param({"ap": "acceptall"}) is None
+
+
+def test_write_threshold_configs_names_values_with_repr(tmp_path):
+    base = tmp_path / "config.json"
+    base.write_text(json.dumps({"trace": "t/full_0_0.1.trace", "output_dir": str(tmp_path / "out")}))
+
+    sweep_dir, paths = write_threshold_configs(base, "ap_probability", [0.6059761, 0.6059764])
+
+    assert sweep_dir == tmp_path / "out" / "ap_probability_sweep"
+    assert [p.parent.name for p in paths] == ["ap_probability_0.6059761", "ap_probability_0.6059764"]
+    assert json.loads(paths[1].read_text())["ap_probability"] == 0.6059764
+
+
+def test_write_threshold_configs_rejects_duplicates(tmp_path):
+    base = tmp_path / "config.json"
+    base.write_text(json.dumps({"trace": "t/full_0_0.1.trace", "output_dir": str(tmp_path / "out")}))
+    with pytest.raises(ValueError):
+        write_threshold_configs(base, "ap_probability", [0.5, 0.5])